@@ -1,16 +1,156 @@
 import sys, os
+import asyncio
 import requests
 from langchain_openai import ChatOpenAI 
 from langchain.agents import initialize_agent, AgentType
 from tools.azure_search_service import azure_ai_search
 from tools.github_issues import GetIssueTool
-from tools.repo_utils import ListRepoFilesTool, find_relevant_code
+from tools.repo_utils import ListRepoFilesTool, find_relevant_code, repo_clone_dir
+from tools.symbol_index import load_symbol_index
+from tools.issue_index import SimilarIssueIndex
+from chains.issue_triage import triage_issue
 from dotenv import load_dotenv
 
 load_dotenv()
 ALLOW_AZURE_AI_SEARCH = os.getenv("ALLOW_AZURE_AI_SEARCH", "false").lower() == "true"
+ALLOW_FAST_PATH = os.getenv("ALLOW_FAST_PATH", "true").lower() == "true"
+SIMILAR_ISSUE_THRESHOLD = float(os.getenv("SIMILAR_ISSUE_THRESHOLD", "0.8"))
+SIMILAR_TITLE_THRESHOLD = float(os.getenv("SIMILAR_TITLE_THRESHOLD", "0.5"))
+
+async def _gather_issue_context(repo_name: str, issue: dict):
+    """List the repo files and retrieve code for the issue concurrently.
+
+    Files referenced by the issue are resolved through the symbol index first.
+    When a traceback frame or path resolves, retrieval is skipped and the file
+    list narrows to the symbol matches; otherwise the matches are only passed
+    on as likely files next to the full list.
+    """
+    retriever = azure_ai_search if ALLOW_AZURE_AI_SEARCH else find_relevant_code
+    issue_text = f"{issue['title']}\n\n{issue['body'] or ''}"
+    repo_dir = repo_clone_dir(repo_name)
+
+    def list_files():
+        file_list = ListRepoFilesTool().invoke(repo_name)
+        if file_list.startswith("Error:"):
+            raise RuntimeError(file_list)
+        return file_list
+
+    def retrieve():
+        return retriever.invoke({
+            "repo_url": f"https://github.com/{repo_name}",
+            "issue_text": issue_text,
+        })
+
+    def find_issue_files():
+        return load_symbol_index(repo_dir).find_issue_files(issue_text)
+
+    if os.path.isdir(repo_dir):
+        # A warm clone's index answers before any embedding work starts
+        resolved, candidates = await asyncio.to_thread(find_issue_files)
+        if resolved:
+            return "\n".join(candidates), [], candidates
+        file_list, snippets = await asyncio.gather(
+            asyncio.to_thread(list_files),
+            asyncio.to_thread(retrieve),
+        )
+        return file_list, snippets, candidates
+
+    # Cold clone: the index needs the clone, so start retrieval alongside it
+    retrieval = asyncio.create_task(asyncio.to_thread(retrieve))
+    try:
+        file_list = await asyncio.to_thread(list_files)
+        resolved, candidates = await asyncio.to_thread(find_issue_files)
+    except BaseException:
+        retrieval.cancel()
+        raise
+
+    if resolved:
+        # The worker thread cannot be interrupted; its result is simply dropped
+        retrieval.cancel()
+        return "\n".join(candidates), [], candidates
+    return file_list, await retrieval, candidates
+
+async def run_issue_pipeline(repo_name: str, issue: dict):
+    """Triage an issue with concurrent tool calls and a single structured LLM call."""
+    file_list, snippets, likely_files = await _gather_issue_context(repo_name, issue)
+    triage = await asyncio.to_thread(
+        triage_issue, issue["title"], issue["body"], file_list, snippets, likely_files
+    )
+    # Drop paths the model invented; they would otherwise be cached for duplicates too
+    known_files = set(file_list.splitlines())
+    relevant_files = [p for p in dict.fromkeys(triage.relevant_files) if p in known_files]
+    yield f"Summary: {triage.summary}"
+    yield "Relevant files:"
+    for path in relevant_files:
+        yield f"- {path}"
+    yield f"Estimated effort: {triage.effort_hours:g} hours"
 
 async def run_issue_analysis(repo_name: str, issue_number: str):
+    """Run the issue analysis on a given repo and issue number.
+
+    Near-duplicates of previously analyzed issues are answered from the
+    similar-issue index. Otherwise the parallel pipeline is used when
+    ALLOW_FAST_PATH is enabled, falling back to the multi-turn agent if it fails.
+    """
+    try:
+        issue = await asyncio.to_thread(GetIssueTool().invoke, f"{repo_name}#{issue_number}")
+    except Exception as e:
+        # Let the agent surface the error in its own output
+        print(f"Could not fetch issue, falling back to agent: {e}")
+        issue = None
+
+    # The index is only a cache: unreadable files count as a miss
+    try:
+        index = SimilarIssueIndex(repo_name)
+    except (OSError, ValueError) as e:
+        print(f"Could not load similar-issue index: {e}")
+        index = None
+
+    if issue is not None and index is not None:
+        match = index.find_similar(
+            issue_number, issue["title"], issue["body"],
+            SIMILAR_ISSUE_THRESHOLD, SIMILAR_TITLE_THRESHOLD,
+        )
+        if match:
+            entry, score = match
+            yield (
+                f"This issue looks like a duplicate of #{entry['number']} "
+                f"({entry['url']}, similarity {score:.0%}). Reusing its analysis."
+            )
+            for step in entry["analysis"]:
+                yield step
+            return
+
+    steps = None
+    if ALLOW_FAST_PATH and issue is not None:
+        try:
+            steps = [step async for step in run_issue_pipeline(repo_name, issue)]
+        except Exception as e:
+            print(f"Fast path failed, falling back to agent: {e}")
+
+    if steps is None:
+        steps = []
+        async for step in run_issue_agent(repo_name, issue_number):
+            steps.append(step)
+            yield step
+        if issue is not None and not any(s.startswith("Error during execution") for s in steps):
+            _store_analysis(index, issue_number, issue, steps)
+        return
+
+    _store_analysis(index, issue_number, issue, steps)
+    for step in steps:
+        yield step
+
+def _store_analysis(index, issue_number: str, issue: dict, steps: list):
+    """Record an analysis in the similar-issue index, skipping the store on I/O errors."""
+    if index is None:
+        return
+    try:
+        index.add(issue_number, issue, steps)
+    except (OSError, ValueError) as e:
+        print(f"Could not update similar-issue index: {e}")
+
+async def run_issue_agent(repo_name: str, issue_number: str):
     """Run the issue analysis agent on a given repo and issue number."""
     llm = ChatOpenAI(
         model_name="gpt-4",
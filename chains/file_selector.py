@@ -4,6 +4,7 @@ from langchain.schema.runnable import RunnableSequence  # Updated import
 from langchain_openai import OpenAI  # Updated import
 from dotenv import load_dotenv
 from tools.repo_utils import clone_repository, gather_file_list
+from tools.symbol_index import load_symbol_index
 
 def predict_files_for_issue(issue_summary: str, repo: str, clone_dir: str = "repo_clone") -> list:
     """
@@ -11,10 +12,18 @@ def predict_files_for_issue(issue_summary: str, repo: str, clone_dir: str = "rep
     this function clones the repo (if needed), gathers the file structure, 
     and uses an LLM to predict which files might need changes to resolve the issue.
     Returns the LLM's output (a list of file paths likely involved).
+    Files that traceback frames or file paths in the summary resolve to through
+    the symbol index are returned directly; other symbol matches are passed to
+    the LLM as likely files alongside the full list.
     """
     # Ensure repository is cloned to the specified directory
     clone_repository(repo, clone_dir)
 
+    # Resolve identifiers, paths and traceback frames before involving the LLM
+    resolved, candidates = load_symbol_index(clone_dir).find_issue_files(issue_summary)
+    if resolved:
+        return resolved
+
     # Get the list of files in the repository
     file_list = gather_file_list(clone_dir)
     if not file_list:
@@ -26,8 +35,11 @@ def predict_files_for_issue(issue_summary: str, repo: str, clone_dir: str = "rep
         prompt_template_str = f.read()
     prompt = PromptTemplate(input_variables=["summary", "file_list"], template=prompt_template_str)
 
-    # Prepare the file list as a string
-    file_list_str = "\n".join(file_list)
+    # Prepare the file list as a string, leading with any symbol matches as hints
+    file_list_str = file_list
+    if candidates:
+        likely = "\n".join(candidates)
+        file_list_str = f"Likely files (from symbol lookup):\n{likely}\n\nAll files:\n{file_list}"
 
     # Initialize the LLM (OpenAI model) via LangChain
     load_dotenv()
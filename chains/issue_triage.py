@@ -0,0 +1,54 @@
+import os
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from langchain_core.prompts import PromptTemplate
+from langchain_openai import ChatOpenAI
+from dotenv import load_dotenv
+
+class IssueTriage(BaseModel):
+    """Structured triage result for a GitHub issue."""
+    summary: str = Field(description="A concise summary of the issue.")
+    relevant_files: List[str] = Field(description="Repository file paths likely to need changes.")
+    effort_hours: float = Field(description="Estimated effort to fix the issue, in hours.")
+
+def format_snippets(snippets: list) -> str:
+    """Render retrieval results (dicts with 'source' and 'snippet') as prompt text."""
+    if not snippets:
+        return "No snippets retrieved."
+    return "\n\n".join(f"{s.get('source', '')}:\n{s.get('snippet', '')}" for s in snippets)
+
+def triage_issue(title: str, body: str, file_list: str, snippets: list,
+                 likely_files: Optional[List[str]] = None) -> IssueTriage:
+    """
+    Summarize an issue, pick the relevant files and estimate the effort
+    in a single structured LLM call. likely_files are offered as hints.
+    Returns an IssueTriage object.
+    """
+    # Load the triage prompt template from file
+    prompt_path = os.path.join(os.path.dirname(__file__), "..", "prompts", "triage_issue.txt")
+    with open(prompt_path, "r") as f:
+        prompt_template_str = f.read()
+    prompt = PromptTemplate(
+        input_variables=["title", "body", "file_list", "likely_files", "snippets"],
+        template=prompt_template_str,
+    )
+
+    # Initialize the LLM (OpenAI chat model) via LangChain
+    load_dotenv()
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        raise ValueError("Missing OPENAI_API_KEY. Please set it in your environment variables.")
+
+    llm = ChatOpenAI(model_name="gpt-4", temperature=0, openai_api_key=openai_api_key)
+
+    # Bind the output schema so the model answers with an IssueTriage object.
+    # gpt-4 has no json_schema support, which newer langchain-openai uses by default.
+    chain = prompt | llm.with_structured_output(IssueTriage, method="function_calling")
+
+    return chain.invoke({
+        "title": title,
+        "body": body or "",
+        "file_list": file_list,
+        "likely_files": "\n".join(likely_files) if likely_files else "None found.",
+        "snippets": format_snippets(snippets),
+    })
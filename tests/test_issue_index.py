@@ -0,0 +1,92 @@
+import json
+import threading
+
+from tools.issue_index import SimilarIssueIndex, minhash_signature, strip_template
+
+BUG_TEMPLATE = """**Describe the bug**
+A clear and concise description of what the bug is.
+{0}
+
+**To Reproduce**
+Steps to reproduce the behavior:
+1. Go to '...'
+2. Click on '....'
+3. Scroll down to '....'
+4. See error
+
+**Expected behavior**
+A clear and concise description of what you expected to happen.
+
+**Screenshots**
+If applicable, add screenshots to help explain your problem.
+
+**Desktop (please complete the following information):**
+ - OS: [e.g. iOS]
+ - Browser [e.g. chrome, safari]
+ - Version [e.g. 22]
+
+**Additional context**
+Add any other context about the problem here."""
+
+LOGIN_BODY = "Clicking the login button on the home page does nothing and no request is sent to the server."
+EXPORT_BODY = "Exporting a report to CSV crashes the app with a TypeError about a missing column name."
+
+def test_strip_template_removes_boilerplate_only():
+    assert strip_template(BUG_TEMPLATE.format(LOGIN_BODY)) == LOGIN_BODY
+
+def test_strip_template_keeps_content_starting_with_template_words():
+    body = "Browser shows a blank page instead of redirecting users to the dashboard.\nEnvironment variables are ignored."
+    assert strip_template(body) == body
+
+def test_short_or_symbol_only_text_has_no_signature():
+    assert minhash_signature("Build fails") is None
+    assert minhash_signature("!!! ??? ...") is None
+    assert minhash_signature("") is None
+
+def test_template_issues_with_unrelated_content_do_not_match(tmp_path):
+    index = SimilarIssueIndex("owner/repo", str(tmp_path))
+    index.add("1", {"title": "Login button broken", "body": BUG_TEMPLATE.format(LOGIN_BODY)}, ["a"])
+    assert index.find_similar("2", "Export crashes", BUG_TEMPLATE.format(EXPORT_BODY), 0.8, 0.5) is None
+
+def test_near_duplicate_matches(tmp_path):
+    index = SimilarIssueIndex("owner/repo", str(tmp_path))
+    index.add("1", {"title": "Login button broken", "body": BUG_TEMPLATE.format(LOGIN_BODY)}, ["a"])
+    entry, score = index.find_similar(
+        "2", "Login button is broken", BUG_TEMPLATE.format(LOGIN_BODY), 0.8, 0.5
+    )
+    assert entry["number"] == "1" and entry["analysis"] == ["a"]
+    assert score >= 0.8
+
+def test_dissimilar_title_does_not_match(tmp_path):
+    index = SimilarIssueIndex("owner/repo", str(tmp_path))
+    index.add("1", {"title": "Login button broken", "body": LOGIN_BODY}, ["a"])
+    assert index.find_similar("2", "Export crashes", LOGIN_BODY, 0.8, 0.5) is None
+
+def test_title_only_issues_do_not_match(tmp_path):
+    index = SimilarIssueIndex("owner/repo", str(tmp_path))
+    index.add("1", {"title": "Build fails", "body": ""}, ["a"])
+    assert index.find_similar("2", "Build fails", "", 0.8, 0.5) is None
+
+def test_same_issue_number_is_not_matched(tmp_path):
+    index = SimilarIssueIndex("owner/repo", str(tmp_path))
+    index.add("1", {"title": "Login button broken", "body": LOGIN_BODY}, ["a"])
+    assert index.find_similar("1", "Login button broken", LOGIN_BODY, 0.8, 0.5) is None
+
+def test_concurrent_adds_keep_every_entry(tmp_path):
+    # All writers load before any of them writes
+    indexes = [SimilarIssueIndex("owner/repo", str(tmp_path)) for _ in range(8)]
+    barrier = threading.Barrier(len(indexes))
+
+    def add(i):
+        barrier.wait()
+        indexes[i].add(str(i), {"title": f"Issue {i}", "body": ""}, [])
+
+    threads = [threading.Thread(target=add, args=(i,)) for i in range(len(indexes))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with open(indexes[0].path) as f:
+        numbers = sorted(int(e["number"]) for e in json.load(f)["issues"])
+    assert numbers == list(range(len(indexes)))
@@ -0,0 +1,70 @@
+import pytest
+
+from tools.symbol_index import build_symbol_index, extract_issue_references
+
+REPO_FILES = {
+    "utils.py": "def helper():\n    pass\n",
+    "app.py": "import utils\n",
+    "cli.py": "import utils\n",
+    "pkg/__init__.py": "",
+    "pkg/app.py": "import json\nimport logging\nimport utils\nimport lib.core\nfrom pkg import cli\n",
+    "pkg/cli.py": "",
+    "other/json.py": "",
+    "other/logging.py": "",
+    "src/lib/__init__.py": "",
+    "src/lib/core.py": "",
+    "app/models/base.py": "class Model:\n    pass\n",
+    "client.py": "class Client:\n    def send(self):\n        pass\n",
+}
+# Enough unrelated definitions of "send" to make the bare name ambiguous
+REPO_FILES.update({f"handlers/h{i}.py": "def send():\n    pass\n" for i in range(6)})
+
+@pytest.fixture
+def index(tmp_path):
+    for path, source in REPO_FILES.items():
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(source)
+    return build_symbol_index(str(tmp_path))
+
+def test_extract_issue_references():
+    refs = extract_issue_references(
+        'Traceback (most recent call last):\n'
+        '  File "/app/pkg/app.py", line 4, in run\n'
+        'See utils.py:12, e.g. `Client.send` or os.path.join, i.e. nothing works.'
+    )
+    assert refs["frames"] == [("/app/pkg/app.py", 4, "run")]
+    assert refs["paths"] == ["utils.py"]
+    assert refs["identifiers"][:2] == ["Client.send", "os.path.join"]
+    assert "e.g" not in refs["identifiers"] and "i.e" not in refs["identifiers"]
+
+def test_lookup_identifier_prefers_qualified_name(index):
+    assert index.lookup_identifier("Client.send") == ["client.py"]
+    assert len(index.lookup_identifier("send")) == 7
+
+def test_find_issue_files_qualified_method(index):
+    resolved, candidates = index.find_issue_files("`Client.send` hangs")
+    assert resolved == []
+    assert candidates == ["client.py"]
+
+def test_match_path_requires_full_or_top_level_suffix(index):
+    assert index.match_path("/app/pkg/app.py") == ["pkg/app.py"]
+    assert index.match_path("/srv/django/db/models/base.py") == []
+    assert sorted(index.match_path("app.py")) == ["app.py", "pkg/app.py"]
+
+def test_third_party_frames_do_not_resolve(index):
+    resolved, candidates = index.find_issue_files(
+        'File "/usr/lib/python3.11/site-packages/django/db/models/base.py", line 1, in save'
+    )
+    assert resolved == [] and "app/models/base.py" not in candidates
+    resolved, _ = index.find_issue_files('File "/usr/lib/python3.11/json/decoder.py", line 3, in decode')
+    assert resolved == []
+
+def test_find_issue_files_returns_only_resolved_files_directly(index):
+    resolved, candidates = index.find_issue_files("Error in utils.py")
+    assert resolved == ["utils.py"]
+    assert set(candidates) == {"utils.py", "app.py", "cli.py", "pkg/app.py"}
+
+def test_absolute_imports_resolve_from_top_level_packages(index):
+    assert index.imports["pkg/app.py"] == ["utils.py", "src/lib/core.py", "pkg/__init__.py", "pkg/cli.py"]
+    assert "other/json.py" not in index.imported_by
+    assert "other/logging.py" not in index.imported_by
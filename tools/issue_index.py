@@ -0,0 +1,175 @@
+import os
+import re
+import json
+import random
+import hashlib
+import tempfile
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent writes fall back to last-writer-wins
+    fcntl = None
+
+NUM_PERM = 128
+SHINGLE_SIZE = 3
+# Bodies with fewer distinct shingles than this are too short to compare reliably
+MIN_SHINGLES = 8
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed so signatures stay comparable across runs and processes
+_rng = random.Random(1)
+_PERMUTATIONS = [
+    (_rng.randint(1, _MERSENNE_PRIME - 1), _rng.randint(0, _MERSENNE_PRIME - 1))
+    for _ in range(NUM_PERM)
+]
+
+# Prompts and labels from common GitHub issue templates (bug report, feature request),
+# compared against whole lines with any trailing ":" or "." removed
+_TEMPLATE_PHRASES = {
+    "describe the bug", "to reproduce", "steps to reproduce", "steps to reproduce the behavior",
+    "see error", "expected behavior", "expected behaviour", "actual behavior", "actual behaviour",
+    "screenshots", "additional context", "environment", "os", "browser", "version", "device",
+    "python version", "desktop (please complete the following information)",
+    "smartphone (please complete the following information)",
+    "a clear and concise description of what the bug is",
+    "a clear and concise description of what you expected to happen",
+    "if applicable, add screenshots to help explain your problem",
+    "add any other context about the problem here",
+    "is your feature request related to a problem? please describe",
+    "describe the solution you'd like", "describe alternatives you've considered",
+    "a clear and concise description of what you want to happen",
+    "a clear and concise description of any alternative solutions or features you've considered",
+    "add any other context or screenshots about the feature request here",
+}
+_LIST_MARKER_RE = re.compile(r"^(?:[-*>]|\d+[.)])\s*")
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_TEMPLATE_LINE_RE = re.compile(
+    r"^(?:#+\s|\*\*[^*]+\*\*:?$|[-*]\s*\[[ xX]\]|.*\[e\.g\.|.*\[\.\.\.\]|.*'\.{3,}')"
+)
+
+def strip_template(body: Optional[str]) -> str:
+    """Remove issue-template headings, prompts and placeholder lines from an issue body."""
+    body = _HTML_COMMENT_RE.sub("", body or "")
+    lines = []
+    for line in body.splitlines():
+        stripped = _LIST_MARKER_RE.sub("", line.strip())
+        if not stripped or _TEMPLATE_LINE_RE.match(line.strip()):
+            continue
+        lowered = stripped.lower().strip("*_ ")
+        if lowered.rstrip(":.").strip() in _TEMPLATE_PHRASES:
+            continue
+        # Short label lines such as "Logs:" or "Version" carry no content of their own
+        if lowered.endswith(":") and len(lowered.split()) <= 4:
+            continue
+        lines.append(stripped)
+    return "\n".join(lines)
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"\w+", text.lower())
+
+def _shingles(text: str) -> set:
+    """Split text into lowercase word n-grams."""
+    words = _words(text)
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+def minhash_signature(text: str) -> Optional[List[int]]:
+    """Compute a MinHash signature of the word shingles in text, or None if text is too short."""
+    shingles = _shingles(text)
+    if len(shingles) < MIN_SHINGLES:
+        return None
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+        for s in shingles
+    ]
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+def estimate_similarity(sig_a: List[int], sig_b: List[int]) -> float:
+    """Estimate the Jaccard similarity of two MinHash signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+def title_similarity(tokens_a: List[str], tokens_b: List[str]) -> float:
+    """Exact Jaccard similarity of two titles' word sets."""
+    a, b = set(tokens_a), set(tokens_b)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+class SimilarIssueIndex:
+    """Persistent per-repo index of analyzed issues, keyed by their titles and MinHash signatures of their bodies."""
+
+    def __init__(self, repo_name: str, index_dir: Optional[str] = None):
+        # Directory to store the indexes (one JSON file per repository)
+        index_dir = index_dir or os.path.join(os.getcwd(), "issue_index")
+        os.makedirs(index_dir, exist_ok=True)
+        self.path = os.path.join(index_dir, f"{repo_name.replace('/', '_')}.json")
+        self.issues = self._load()
+
+    @contextmanager
+    def _locked(self):
+        """Hold an exclusive lock on the index for a read-modify-write."""
+        with open(f"{self.path}.lock", "w") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self) -> List[dict]:
+        if not os.path.isfile(self.path):
+            return []
+        with open(self.path, "r") as f:
+            return json.load(f).get("issues", [])
+
+    def find_similar(self, issue_number: str, title: str, body: Optional[str],
+                     threshold: float, title_threshold: float) -> Optional[Tuple[dict, float]]:
+        """
+        Return the most similar previously analyzed issue and its body score.
+        Both the title and the template-stripped body must clear their thresholds;
+        bodies too short to fingerprint never match.
+        """
+        signature = minhash_signature(strip_template(body))
+        if signature is None:
+            return None
+        title_tokens = _words(title)
+        best, best_score = None, 0.0
+        for entry in self.issues:
+            # A re-run of the same issue should be analyzed again, not matched to itself
+            if str(entry["number"]) == str(issue_number) or not entry.get("body_signature"):
+                continue
+            if title_similarity(title_tokens, entry["title_tokens"]) < title_threshold:
+                continue
+            score = estimate_similarity(signature, entry["body_signature"])
+            if score > best_score:
+                best, best_score = entry, score
+        if best is None or best_score < threshold:
+            return None
+        return best, best_score
+
+    def add(self, issue_number: str, issue: dict, analysis: List[str]) -> None:
+        """Store the analysis of an issue, replacing any earlier entry for the same number."""
+        entry = {
+            "number": str(issue_number),
+            "title": issue["title"],
+            "url": issue.get("url", ""),
+            "title_tokens": _words(issue["title"]),
+            "body_signature": minhash_signature(strip_template(issue.get("body"))),
+            "analysis": analysis,
+        }
+        with self._locked():
+            # Reload under the lock so entries written by concurrent analyses are kept
+            issues = [e for e in self._load() if str(e["number"]) != str(issue_number)]
+            issues.append(entry)
+            self.issues = issues
+            # Write to a temp file first so a crash never leaves a truncated index
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"issues": self.issues}, f)
+            os.replace(tmp_path, self.path)
@@ -73,6 +73,11 @@ def gather_file_list(root_dir: str) -> str:
     file_paths.sort()
     return "\n".join(file_paths)
 
+def repo_clone_dir(repo_name: str) -> str:
+    """Return the local directory ListRepoFilesTool clones a GitHub repo into."""
+    # Use repo name with owner as part of path (replace slashes with underscores)
+    return os.path.join(os.getcwd(), "repos", repo_name.replace("/", "_"))
+
 class ListRepoFilesTool(BaseTool):
     """Tool to clone a GitHub repo (if not already) and list all text-based file paths."""
     name: str = "list_repo_files"
@@ -83,10 +88,8 @@ class ListRepoFilesTool(BaseTool):
 
     def _run(self, repo_name: str) -> str:
         # Directory to store cloned repositories
-        base_dir = os.path.join(os.getcwd(), "repos")
-        os.makedirs(base_dir, exist_ok=True)
-        # Use repo name with owner as part of path (replace slashes with underscores)
-        repo_dir = os.path.join(base_dir, repo_name.replace("/", "_"))
+        repo_dir = repo_clone_dir(repo_name)
+        os.makedirs(os.path.dirname(repo_dir), exist_ok=True)
         # Clone the repo if not already cloned
         if not os.path.isdir(repo_dir):
             try:
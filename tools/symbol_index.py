@@ -0,0 +1,281 @@
+import os
+import re
+import ast
+import json
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+SKIP_DIRS = {".git", ".github", "__pycache__", "node_modules", "venv"}
+SOURCE_EXTS = {".py", ".js", ".jsx", ".ts", ".tsx", ".go", ".rb", ".java", ".kt", ".rs", ".php", ".c", ".cc", ".cpp", ".h", ".hpp", ".cs", ".swift"}
+JS_EXTS = (".js", ".jsx", ".ts", ".tsx")
+
+# Identifiers defined in more files than this are too common to point anywhere
+MAX_DEFINITION_FILES = 5
+# Bump when the index format or resolution rules change so stale caches are rebuilt
+INDEX_VERSION = 2
+# Directories Python packages are conventionally imported from
+PYTHON_SOURCE_ROOTS = ("", "src/")
+
+# Regex fallback for definitions in non-Python sources
+_DEFINITION_RE = re.compile(
+    r"^\s*(?:export\s+)?(?:default\s+)?(?:public\s+|private\s+|protected\s+|static\s+|async\s+|abstract\s+|final\s+)*"
+    r"(?:def|class|function|func|fn|interface|struct|enum|trait|module|type)\s+\*?([A-Za-z_]\w*)",
+    re.MULTILINE,
+)
+_JS_IMPORT_RE = re.compile(r"""(?:from\s+|require\(\s*|import\s*\(\s*|import\s+)['"](\.{1,2}/[^'"]+)['"]""")
+
+# Issue text patterns
+_PY_FRAME_RE = re.compile(r'File "([^"]+)", line (\d+)(?:, in ([\w<>.]+))?')
+_JS_FRAME_RE = re.compile(r"at (?:([\w$.<>]+) \()?([^\s()]+?\.\w+):(\d+)(?::\d+)?\)?")
+_PATH_RE = re.compile(r"(?<![\w/.])(/?(?:[\w.-]+/)*[\w.-]+\.(?:" + "|".join(e[1:] for e in SOURCE_EXTS) + r"))(?::(\d+))?\b")
+_THIRD_PARTY_RE = re.compile(r"(?:^|/)(?:site-packages|dist-packages|node_modules|lib/python\d+(?:\.\d+)?)/")
+_BACKTICK_RE = re.compile(r"`([^`\s]+)`")
+_CALL_RE = re.compile(r"\b([A-Za-z_][\w.]*)\(")
+_IDENT_RE = re.compile(r"\b([A-Za-z_]\w+(?:\.[A-Za-z_]\w+)+|[a-z]+[A-Z]\w*|[A-Z][a-z0-9]+[A-Z]\w*|[A-Za-z]\w*_\w+)\b")
+
+def extract_issue_references(text: str) -> dict:
+    """
+    Extract traceback frames, file paths and code identifiers from issue text.
+    Returns a dict with 'frames' (list of (path, line, function)), 'paths' and 'identifiers'.
+    """
+    text = text or ""
+    frames = [(path, int(line), func) for path, line, func in _PY_FRAME_RE.findall(text)]
+    frames += [(path, int(line), func) for func, path, line in _JS_FRAME_RE.findall(text)]
+    frame_paths = {path for path, _, _ in frames}
+    paths = [path for path, _ in _PATH_RE.findall(text) if path not in frame_paths]
+
+    identifiers = []
+    for pattern in (_BACKTICK_RE, _CALL_RE, _IDENT_RE):
+        identifiers += pattern.findall(text)
+    identifiers += [func for _, _, func in frames if func and not func.startswith("<")]
+    # Drop anything that is really a file name or path, keeping first-seen order
+    seen = set(paths) | frame_paths
+    unique = []
+    for ident in identifiers:
+        ident = ident.strip("().")
+        if os.path.splitext(ident)[1].lower() in SOURCE_EXTS:
+            continue
+        if ident and ident not in seen and "/" not in ident:
+            seen.add(ident)
+            unique.append(ident)
+    return {"frames": frames, "paths": list(dict.fromkeys(paths)), "identifiers": unique}
+
+class SymbolIndex:
+    """Definitions, path-suffix trie and import-graph neighbours for one commit of a repository."""
+
+    def __init__(self, files: List[str], definitions: Dict[str, List[str]], imports: Dict[str, List[str]]):
+        self.files = files
+        self.definitions = definitions
+        self.imports = imports
+        self.file_set = set(files)
+        # Reverse import edges so neighbours include importers as well as imports
+        self.imported_by = {}
+        for src, targets in imports.items():
+            for target in targets:
+                self.imported_by.setdefault(target, []).append(src)
+        # Trie over reversed path components: "a/b/c.py" -> c.py -> b -> a
+        self.trie = {}
+        for path in files:
+            node = self.trie
+            for part in reversed(path.split("/")):
+                node = node.setdefault(part, {})
+                node.setdefault("", []).append(path)
+
+    def match_path(self, path: str) -> List[str]:
+        """
+        Return repository files matching the given path. A path that is not matched in
+        full only resolves to files its longest matching suffix covers up to the repo's
+        top level, so absolute paths from tracebacks still resolve against the clone
+        while unrelated trees sharing a "models/base.py" tail do not.
+        """
+        parts = [p for p in path.replace("\\", "/").split("/") if p and p != "."]
+        node = self.trie
+        matched, depth = [], 0
+        for part in reversed(parts):
+            if part not in node:
+                break
+            node = node[part]
+            matched, depth = node[""], depth + 1
+        if depth < len(parts):
+            matched = [m for m in matched if m.count("/") + 1 == depth]
+        return matched
+
+    def lookup_identifier(self, identifier: str) -> List[str]:
+        """Return files defining an identifier, trying the longest dotted name first."""
+        parts = identifier.split(".")
+        for i in range(len(parts)):
+            name = ".".join(parts[i:])
+            if name in self.definitions:
+                return self.definitions[name]
+        return []
+
+    def neighbours(self, path: str) -> List[str]:
+        """Return files imported by or importing the given file."""
+        return list(dict.fromkeys(self.imports.get(path, []) + self.imported_by.get(path, [])))
+
+    def find_issue_files(self, issue_text: str) -> Tuple[List[str], List[str]]:
+        """
+        Resolve the files referenced by an issue.
+        Returns (resolved, candidates): resolved holds only the files that a traceback
+        frame or explicit path resolved to unambiguously; candidates holds every
+        match (including identifier definitions) followed by their import neighbours.
+        """
+        refs = extract_issue_references(issue_text)
+        resolved = []
+        direct = []
+        for path in [frame[0] for frame in refs["frames"]] + refs["paths"]:
+            # Library frames can share a tail with repo files but never point into the repo
+            if _THIRD_PARTY_RE.search(path.replace("\\", "/")):
+                continue
+            matches = self.match_path(path)
+            if len(matches) == 1:
+                resolved += matches
+            if len(matches) <= MAX_DEFINITION_FILES:
+                direct += matches
+        for identifier in refs["identifiers"]:
+            matches = self.lookup_identifier(identifier)
+            if len(matches) <= MAX_DEFINITION_FILES:
+                direct += matches
+        direct = list(dict.fromkeys(direct))
+        related = [n for path in direct for n in self.neighbours(path)]
+        return list(dict.fromkeys(resolved)), list(dict.fromkeys(direct + related))
+
+    def to_dict(self) -> dict:
+        return {"files": self.files, "definitions": self.definitions, "imports": self.imports}
+
+def _python_definitions(source: str) -> Tuple[List[str], List[Tuple[str, int]]]:
+    """Return defined names (including Class.method) and imported modules with their relative level."""
+    tree = ast.parse(source)
+    names, modules = [], []
+
+    def visit(node, prefix=""):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                names.append(child.name)
+                if prefix:
+                    names.append(f"{prefix}.{child.name}")
+                visit(child, child.name if isinstance(child, ast.ClassDef) else prefix)
+            elif isinstance(child, ast.Import):
+                modules.extend((alias.name, 0) for alias in child.names)
+            elif isinstance(child, ast.ImportFrom):
+                base = child.module or ""
+                modules.append((base, child.level))
+                # "from pkg import mod" may import a submodule
+                modules.extend((f"{base}.{alias.name}" if base else alias.name, child.level) for alias in child.names)
+            else:
+                visit(child, prefix)
+
+    visit(tree)
+    return names, modules
+
+def _resolve_python_import(index: SymbolIndex, src: str, module: str, level: int) -> List[str]:
+    if level:
+        base = src.split("/")[:-level]
+        parts = base + [p for p in module.split(".") if p]
+        candidates = ["/".join(parts) + ".py", "/".join(parts + ["__init__.py"])]
+        return [c for c in candidates if c in index.file_set]
+    if not module:
+        return []
+    # Absolute imports resolve from the repo's top-level packages only, so stdlib and
+    # third-party modules never link to a same-named file deeper in the tree
+    stem = module.replace(".", "/")
+    for root in PYTHON_SOURCE_ROOTS:
+        for candidate in (f"{root}{stem}.py", f"{root}{stem}/__init__.py"):
+            if candidate in index.file_set:
+                return [candidate]
+    return []
+
+def _resolve_js_import(index: SymbolIndex, src: str, spec: str) -> List[str]:
+    base = os.path.normpath(os.path.join(os.path.dirname(src), spec)).replace("\\", "/")
+    candidates = [base] + [base + ext for ext in JS_EXTS] + [f"{base}/index{ext}" for ext in JS_EXTS]
+    return [c for c in candidates if c in index.file_set][:1]
+
+def build_symbol_index(repo_dir: str) -> SymbolIndex:
+    """Walk a cloned repository and build its symbol index."""
+    files = []
+    for root, dirs, filenames in os.walk(repo_dir):
+        # Prune hidden and skip directories
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d not in SKIP_DIRS]
+        for fname in filenames:
+            if fname.startswith("."):
+                continue
+            files.append(os.path.relpath(os.path.join(root, fname), repo_dir).replace(os.sep, "/"))
+    files.sort()
+
+    definitions = {}
+    raw_imports = {}
+    for path in files:
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in SOURCE_EXTS:
+            continue
+        try:
+            with open(os.path.join(repo_dir, path), "r", encoding="utf-8") as f:
+                source = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        names, modules = [], []
+        if ext == ".py":
+            try:
+                names, modules = _python_definitions(source)
+            except (SyntaxError, ValueError):
+                names = _DEFINITION_RE.findall(source)
+        else:
+            names = _DEFINITION_RE.findall(source)
+            if ext in JS_EXTS:
+                modules = _JS_IMPORT_RE.findall(source)
+        for name in dict.fromkeys(names):
+            definitions.setdefault(name, []).append(path)
+        if modules:
+            raw_imports[path] = modules
+
+    # Resolve imports once the trie over all files exists
+    index = SymbolIndex(files, definitions, {})
+    imports = {}
+    for src, modules in raw_imports.items():
+        targets = []
+        for module in modules:
+            if isinstance(module, tuple):
+                targets += _resolve_python_import(index, src, *module)
+            else:
+                targets += _resolve_js_import(index, src, module)
+        targets = [t for t in dict.fromkeys(targets) if t != src]
+        if targets:
+            imports[src] = targets
+    return SymbolIndex(files, definitions, imports)
+
+_INDEX_CACHE = {}
+
+def _head_commit(repo_dir: str) -> Optional[str]:
+    result = subprocess.run(
+        ["git", "-C", repo_dir, "rev-parse", "HEAD"], capture_output=True, text=True
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+def load_symbol_index(repo_dir: str, index_dir: Optional[str] = None) -> SymbolIndex:
+    """
+    Return the symbol index for the commit currently checked out in repo_dir.
+    Indexes are cached in memory and on disk per commit, so each commit is only parsed once.
+    """
+    commit = _head_commit(repo_dir)
+    if commit is None:
+        return build_symbol_index(repo_dir)
+    key = (os.path.abspath(repo_dir), commit)
+    if key in _INDEX_CACHE:
+        return _INDEX_CACHE[key]
+
+    # Directory to store the indexes (one JSON file per repository commit)
+    index_dir = index_dir or os.path.join(os.getcwd(), "symbol_index")
+    os.makedirs(index_dir, exist_ok=True)
+    path = os.path.join(index_dir, f"{os.path.basename(os.path.abspath(repo_dir))}_{commit}_v{INDEX_VERSION}.json")
+    if os.path.isfile(path):
+        with open(path, "r") as f:
+            index = SymbolIndex(**json.load(f))
+    else:
+        index = build_symbol_index(repo_dir)
+        # Write to a temp file first so a crash never leaves a truncated index
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index.to_dict(), f)
+        os.replace(tmp_path, path)
+    _INDEX_CACHE[key] = index
+    return index